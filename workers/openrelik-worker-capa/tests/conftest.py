@@ -0,0 +1,25 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared pytest fixtures."""
+
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture(scope="module")
+def mock_send_event():
+    """Mock Task.send_event so task.apply() does not publish events to a broker."""
+    with patch("celery.app.task.Task.send_event") as mock_send_event:
+        yield mock_send_event
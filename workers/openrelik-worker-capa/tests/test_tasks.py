@@ -20,18 +20,16 @@ from unittest.mock import MagicMock, patch
 from src import tasks
 
 
-@pytest.fixture
-def mock_celery_task():
-    """Mock the Celery task instance (self)."""
-    task = MagicMock()
-    task.send_event = MagicMock()
-    return task
+@pytest.fixture(autouse=True)
+def reset_module_mocks(mock_send_event):
+    """Reset the module scoped mocks so call assertions stay per test."""
+    mock_send_event.reset_mock(return_value=True, side_effect=True)
 
 
 @patch("src.tasks.get_input_files")
 @patch("src.tasks.create_output_file")
 @patch("src.tasks.create_task_result")
-@patch("src.tasks.subprocess.Popen")
+@patch("src.tasks.subprocess.Popen", autospec=True)
 @patch("builtins.open")
 def test_capa_task(
     mock_open,
@@ -39,7 +37,7 @@ def test_capa_task(
     mock_create_task_result,
     mock_create_output_file,
     mock_get_input_files,
-    mock_celery_task,
+    mock_send_event,
 ):
     """Test the capa task."""
     # Setup mocks
@@ -53,35 +51,35 @@ def test_capa_task(
     mock_output_file.to_dict.return_value = {"path": "/path/to/output.json"}
     mock_create_output_file.return_value = mock_output_file
 
-    # Mock subprocess.Popen
-    mock_process = MagicMock()
+    # Popen is autospecced, so return_value is a Popen instance mock
+    mock_process = mock_popen.return_value
     mock_process.wait.return_value = None
-    mock_popen.return_value = mock_process
 
     # Call the task
-    tasks.capa.__class__.run(
-        mock_celery_task,
-        pipe_result="dummy_pipe_result",
-        input_files=[
-            {"display_name": "test_file.exe", "path": "/path/to/test_file.exe"}
-        ],
-        output_path="/tmp",
-        workflow_id="workflow_123",
-        task_config={},
-    )
+    tasks.capa.apply(
+        kwargs={
+            "pipe_result": "dummy_pipe_result",
+            "input_files": [
+                {"display_name": "test_file.exe", "path": "/path/to/test_file.exe"}
+            ],
+            "output_path": "/tmp",
+            "workflow_id": "workflow_123",
+            "task_config": {},
+        }
+    ).get()
 
     # Verify assertions
     mock_get_input_files.assert_called_once()
     assert mock_create_output_file.call_count == 3  # json, summary, detailed
     assert mock_popen.call_count == 3
     mock_create_task_result.assert_called_once()
-    mock_celery_task.send_event.assert_called()
+    mock_send_event.assert_called()
 
 
 @patch("src.tasks.get_input_files")
 @patch("src.tasks.create_output_file")
 @patch("src.tasks.create_task_result")
-@patch("src.tasks.subprocess.Popen")
+@patch("src.tasks.subprocess.Popen", autospec=True)
 @patch("builtins.open")
 def test_capa_task_no_files(
     mock_open,
@@ -89,19 +87,20 @@ def test_capa_task_no_files(
     mock_create_task_result,
     mock_create_output_file,
     mock_get_input_files,
-    mock_celery_task,
+    mock_send_event,
 ):
     """Test the capa task with no input files."""
     mock_get_input_files.return_value = []
 
-    tasks.capa.__class__.run(
-        mock_celery_task,
-        pipe_result=None,
-        input_files=[],
-        output_path="/tmp",
-        workflow_id="workflow_123",
-        task_config={},
-    )
+    tasks.capa.apply(
+        kwargs={
+            "pipe_result": None,
+            "input_files": [],
+            "output_path": "/tmp",
+            "workflow_id": "workflow_123",
+            "task_config": {},
+        }
+    ).get()
 
     mock_popen.assert_not_called()
     mock_create_output_file.assert_not_called()
@@ -0,0 +1,53 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared pytest fixtures."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+
+@pytest.fixture(scope="module")
+def mock_send_event():
+    """Mock Task.send_event so task.apply() does not publish events to a broker."""
+    with patch("celery.app.task.Task.send_event") as mock_send_event:
+        yield mock_send_event
+
+
+@pytest.fixture(autouse=True)
+def reset_module_mocks(request):
+    """Reset the module scoped mocks so call assertions stay per test."""
+    mocks = []
+    if "mock_send_event" in request.fixturenames:
+        mocks.append(request.getfixturevalue("mock_send_event"))
+    if "mock_dependencies" in request.fixturenames:
+        mocks.extend(request.getfixturevalue("mock_dependencies").values())
+    for mock in mocks:
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def fake_path():
+    """Factory for read-only stand-ins of extracted pathlib.Path objects."""
+
+    def _fake_path(name, relative_path):
+        return SimpleNamespace(
+            is_file=lambda: True,
+            name=name,
+            absolute=lambda: SimpleNamespace(name=name),
+            relative_to=lambda _root: relative_path,
+        )
+
+    return _fake_path
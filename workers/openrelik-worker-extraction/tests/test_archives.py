@@ -11,46 +11,34 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+
 import pytest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 
 from src import archives
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_dependencies():
     """Mocks dependencies for extract_archive_task."""
-    with (
-        patch("src.archives.get_input_files") as mock_get_input_files,
-        patch("src.archives.create_output_file") as mock_create_output_file,
-        patch("src.archives.extract_archive") as mock_extract_archive,
-        patch("src.archives.create_task_result") as mock_create_task_result,
-        patch("src.archives.shutil.rmtree") as mock_rmtree,
-        patch("src.archives.os.rename") as mock_rename,
-        patch("src.archives.Path") as mock_path,
-        patch("src.archives.telemetry") as mock_telemetry,
-    ):
-        yield {
-            "get_input_files": mock_get_input_files,
-            "create_output_file": mock_create_output_file,
-            "extract_archive": mock_extract_archive,
-            "create_task_result": mock_create_task_result,
-            "rmtree": mock_rmtree,
-            "rename": mock_rename,
-            "path": mock_path,
-            "telemetry": mock_telemetry,
-        }
-
-
-@pytest.fixture
-def mock_celery_task():
-    """Mock the Celery task instance (self)."""
-    task = MagicMock()
-    task.send_event = MagicMock()
-    return task
-
-
-def test_extract_archive_task_success(mock_celery_task, mock_dependencies):
+    with patch.multiple(
+        "src.archives",
+        get_input_files=DEFAULT,
+        create_output_file=DEFAULT,
+        extract_archive=DEFAULT,
+        create_task_result=DEFAULT,
+        shutil=DEFAULT,
+        os=DEFAULT,
+        Path=DEFAULT,
+        telemetry=DEFAULT,
+    ) as mocks:
+        # The task checks the log file with os.path.isfile, so keep os.path real.
+        mocks["os"].path = os.path
+        yield mocks
+
+
+def test_extract_archive_task_success(mock_send_event, mock_dependencies, fake_path):
     """Test successful execution of extract_archive_task."""
     # Setup mocks
     mock_dependencies["get_input_files"].return_value = [
@@ -78,27 +66,22 @@ def test_extract_archive_task_success(mock_celery_task, mock_dependencies):
 
     # Mock Path and glob
     mock_export_path_obj = Mock()
-    mock_extracted_file = Mock()
-    mock_extracted_file.is_file.return_value = True
-    mock_extracted_file.name = "extracted.txt"
-    mock_extracted_file.relative_to.return_value = "extracted.txt"
-    # Ensure absolute() returns a mock that can be stringified if needed
-    mock_extracted_file.absolute.return_value = "/tmp/export_dir/extracted.txt"
-
+    mock_extracted_file = fake_path("extracted.txt", "extracted.txt")
     mock_export_path_obj.glob.return_value = [mock_extracted_file]
-    mock_dependencies["path"].return_value = mock_export_path_obj
+    mock_dependencies["Path"].return_value = mock_export_path_obj
 
     mock_dependencies["create_task_result"].return_value = "serialized_result"
 
-    # Call the task using __class__.run mock_celery_task as self
-    result = archives.extract_archive_task.__class__.run(
-        mock_celery_task,
-        pipe_result="pipe_res",
-        input_files=None,
-        output_path="/tmp/output",
-        workflow_id="wf1",
-        task_config={"file_filter": "*.txt", "archive_password": "pass"},
-    )
+    # Run the task eagerly
+    result = archives.extract_archive_task.apply(
+        kwargs={
+            "pipe_result": "pipe_res",
+            "input_files": None,
+            "output_path": "/tmp/output",
+            "workflow_id": "wf1",
+            "task_config": {"file_filter": "*.txt", "archive_password": "pass"},
+        }
+    ).get()
 
     # Assertions
     assert result == "serialized_result"
@@ -113,27 +96,28 @@ def test_extract_archive_task_success(mock_celery_task, mock_dependencies):
         ["*.txt"],
         "pass",
     )
-    mock_dependencies["rename"].assert_called_once()
-    mock_dependencies["rmtree"].assert_called_once_with("/tmp/export_dir")
+    mock_dependencies["os"].rename.assert_called_once()
+    mock_dependencies["shutil"].rmtree.assert_called_once_with("/tmp/export_dir")
     mock_dependencies["create_task_result"].assert_called_once()
 
     # Check that task_progress event was sent
-    mock_celery_task.send_event.assert_called_with("task-progress")
+    mock_send_event.assert_called_with("task-progress")
 
 
-def test_extract_archive_task_no_input_files(mock_celery_task, mock_dependencies):
+def test_extract_archive_task_no_input_files(mock_send_event, mock_dependencies):
     """Test extract_archive_task with no input files."""
     mock_dependencies["get_input_files"].return_value = []
     mock_dependencies["create_task_result"].return_value = "empty_result"
 
-    result = archives.extract_archive_task.__class__.run(
-        mock_celery_task,
-        pipe_result=None,
-        input_files=[],
-        output_path="/tmp/output",
-        workflow_id="wf1",
-        task_config={},
-    )
+    result = archives.extract_archive_task.apply(
+        kwargs={
+            "pipe_result": None,
+            "input_files": [],
+            "output_path": "/tmp/output",
+            "workflow_id": "wf1",
+            "task_config": {},
+        }
+    ).get()
 
     assert result == "empty_result"
     mock_dependencies["create_task_result"].assert_called_once_with(
@@ -141,7 +125,7 @@ def test_extract_archive_task_no_input_files(mock_celery_task, mock_dependencies
     )
 
 
-def test_extract_archive_task_exception(mock_celery_task, mock_dependencies):
+def test_extract_archive_task_exception(mock_send_event, mock_dependencies):
     """Test extract_archive_task when extract_archive raises an exception."""
     mock_dependencies["get_input_files"].return_value = [{"id": "file1"}]
     mock_log_file = Mock()
@@ -151,17 +135,18 @@ def test_extract_archive_task_exception(mock_celery_task, mock_dependencies):
     mock_dependencies["extract_archive"].side_effect = Exception("Extraction failed")
 
     with pytest.raises(Exception, match="Extraction failed"):
-        archives.extract_archive_task.__class__.run(
-            mock_celery_task,
-            pipe_result=None,
-            input_files=[{"id": "file1"}],
-            output_path="/tmp/output",
-            workflow_id="wf1",
-            task_config={},
-        )
-
-
-def test_extract_archive_task_file_filter_list(mock_celery_task, mock_dependencies):
+        archives.extract_archive_task.apply(
+            kwargs={
+                "pipe_result": None,
+                "input_files": [{"id": "file1"}],
+                "output_path": "/tmp/output",
+                "workflow_id": "wf1",
+                "task_config": {},
+            }
+        ).get()
+
+
+def test_extract_archive_task_file_filter_list(mock_send_event, mock_dependencies):
     """Test that file filters are correctly parsed."""
     mock_dependencies["get_input_files"].return_value = [
         {"id": "file1", "display_name": "archive.zip"}
@@ -170,16 +155,17 @@ def test_extract_archive_task_file_filter_list(mock_celery_task, mock_dependenci
         path="/tmp/log", to_dict=lambda: {}
     )
     mock_dependencies["extract_archive"].return_value = ("cmd", "/tmp/export")
-    mock_dependencies["path"].return_value.glob.return_value = []
+    mock_dependencies["Path"].return_value.glob.return_value = []
     mock_dependencies["create_task_result"].return_value = "res"
 
-    archives.extract_archive_task.__class__.run(
-        mock_celery_task,
-        input_files=None,
-        output_path="/tmp/output",
-        workflow_id="wf1",
-        task_config={"file_filter": "*.txt,*.log"},
-    )
+    archives.extract_archive_task.apply(
+        kwargs={
+            "input_files": None,
+            "output_path": "/tmp/output",
+            "workflow_id": "wf1",
+            "task_config": {"file_filter": "*.txt,*.log"},
+        }
+    ).get()
 
     # Access the call args to verify file_filter list
     args, _ = mock_dependencies["extract_archive"].call_args
@@ -12,13 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import io
+import os
+import subprocess
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, create_autospec, patch
 
 from src.image_export import get_artifact_types, extract_task
 
 
+def popen_process():
+    """Build a Popen instance mock with text mode stdout and stderr pipes."""
+    process = create_autospec(subprocess.Popen, instance=True)
+    process.stdout = create_autospec(io.TextIOWrapper, instance=True)
+    process.stderr = create_autospec(io.TextIOWrapper, instance=True)
+    return process
+
+
 def test_get_artifact_types_file_not_found(tmp_path):
     """Test get_artifact_types when artifacts_map.json does not exist."""
     original_path = "some/file.txt"
@@ -51,111 +62,88 @@ def test_get_artifact_types_empty_json(tmp_path):
     assert types == []
 
 
-def test_get_artifact_types_found(tmp_path):
-    """Test get_artifact_types when the file is in the map."""
-    map_file = tmp_path / "artifacts_map.json"
-    data = {
-        "ArtifactA": ["path/to/file.txt"],
-        "ArtifactB": ["other/file.txt", "path/to/file.txt"],
-    }
-    map_file.write_text(json.dumps(data))
+@pytest.fixture(scope="module")
+def artifacts_map_dir(tmp_path_factory):
+    """Directory with an artifacts_map.json shared by the read-only tests."""
+    directory = tmp_path_factory.mktemp("artifacts_map")
+    (directory / "artifacts_map.json").write_text(
+        '{"ArtifactA": ["path/to/file.txt"], '
+        '"ArtifactB": ["other/file.txt", "path/to/file.txt"]}'
+    )
+    return directory
+
 
-    types = get_artifact_types(tmp_path, "path/to/file.txt")
+def test_get_artifact_types_found(artifacts_map_dir):
+    """Test get_artifact_types when the file is in the map."""
+    types = get_artifact_types(artifacts_map_dir, "path/to/file.txt")
     assert len(types) == 2
     assert "extraction:image_export:artifact:ArtifactA" in types
     assert "extraction:image_export:artifact:ArtifactB" in types
 
 
-def test_get_artifact_types_not_found_in_valid_map(tmp_path):
+def test_get_artifact_types_not_found_in_valid_map(artifacts_map_dir):
     """Test get_artifact_types when the file is not in the map."""
-    map_file = tmp_path / "artifacts_map.json"
-    data = {"ArtifactA": ["other/file.txt"]}
-    map_file.write_text(json.dumps(data))
-
-    types = get_artifact_types(tmp_path, "path/to/file.txt")
+    types = get_artifact_types(artifacts_map_dir, "missing/file.txt")
     assert types == []
 
 
 @pytest.fixture
 def mock_dependencies():
     """Mocks dependencies for extract_task."""
-    with (
-        patch("src.image_export.get_input_files") as mock_get_input_files,
-        patch("src.image_export.create_output_file") as mock_create_output_file,
-        patch("src.image_export.create_task_result") as mock_create_task_result,
-        patch("src.image_export.subprocess.Popen") as mock_popen,
-        patch("src.image_export.shutil.rmtree") as mock_rmtree,
-        patch("src.image_export.shutil.copy") as mock_copy,
-        patch("src.image_export.os.mkdir") as mock_mkdir,
-        patch("src.image_export.Path.glob") as mock_glob,
-        patch("src.image_export.get_artifact_types") as mock_get_artifact_types,
-    ):
-        yield {
-            "get_input_files": mock_get_input_files,
-            "create_output_file": mock_create_output_file,
-            "create_task_result": mock_create_task_result,
-            "popen": mock_popen,
-            "rmtree": mock_rmtree,
-            "copy": mock_copy,
-            "mkdir": mock_mkdir,
-            "glob": mock_glob,
-            "get_artifact_types": mock_get_artifact_types,
-        }
-
-
-@pytest.fixture
-def mock_celery_task():
-    """Mock the Celery task instance (self)."""
-    task = MagicMock()
-    task.send_event = MagicMock()
-    return task
-
-
-@patch("src.image_export.telemetry")
-def test_extract_task_no_filters(mock_telemetry, mock_celery_task, mock_dependencies):
+    with patch.multiple(
+        "src.image_export",
+        get_input_files=DEFAULT,
+        create_output_file=DEFAULT,
+        create_task_result=DEFAULT,
+        get_artifact_types=DEFAULT,
+        subprocess=DEFAULT,
+        shutil=DEFAULT,
+        os=DEFAULT,
+        Path=DEFAULT,
+        telemetry=DEFAULT,
+    ) as mocks:
+        # The task builds its command with os.path.join, so keep os.path real.
+        mocks["os"].path = os.path
+        yield mocks
+
+
+def test_extract_task_no_filters(mock_send_event, mock_dependencies):
     """Test extract_task raises RuntimeError when no filters are provided."""
     mock_dependencies["get_input_files"].return_value = [{"path": "test.dd", "id": "1"}]
 
     task_config = {}
 
     with pytest.raises(RuntimeError, match="No filters were set"):
-        # Use .__class__.run() to call the underlying function, passing mock self
-        extract_task.__class__.run(
-            mock_celery_task,
-            pipe_result=None,
-            input_files=None,
-            output_path=None,
-            workflow_id=None,
-            task_config=task_config,
-        )
-
-
-@patch("src.image_export.telemetry")
-def test_extract_task_artifact_filter(
-    mock_telemetry, mock_celery_task, mock_dependencies
-):
+        extract_task.apply(
+            kwargs={
+                "pipe_result": None,
+                "input_files": None,
+                "output_path": None,
+                "workflow_id": None,
+                "task_config": task_config,
+            }
+        ).get()
+
+
+def test_extract_task_artifact_filter(mock_send_event, mock_dependencies, fake_path):
     """Test extract_task with artifact filters."""
     mock_dependencies["get_input_files"].return_value = [{"path": "test.dd", "id": "1"}]
     mock_dependencies["create_task_result"].return_value = "task_result"
 
     # Mock subprocess to finish immediately
-    mock_process = MagicMock()
+    mock_process = popen_process()
     mock_process.poll.side_effect = [
         None,
         0,
     ]  # Returns None once (running), then 0 (done)
     mock_process.stdout.read.return_value = "Process output"
     mock_process.stderr.read.return_value = ""
-    mock_dependencies["popen"].return_value = mock_process
+    mock_dependencies["subprocess"].Popen.return_value = mock_process
 
     # Mock file extraction
-    mock_file = MagicMock()
-    mock_file.is_file.return_value = True
-    mock_file.name = "extracted_file.txt"
-    mock_file.absolute.return_value.name = "extracted_file.txt"
-    mock_file.relative_to.return_value = "relative/extracted_file.txt"
+    mock_file = fake_path("extracted_file.txt", "relative/extracted_file.txt")
 
-    mock_dependencies["glob"].return_value = [mock_file]
+    mock_dependencies["Path"].return_value.glob.return_value = [mock_file]
 
     mock_dependencies["get_artifact_types"].return_value = [
         "extraction:image_export:artifact:TestArtifact"
@@ -163,37 +151,37 @@ def test_extract_task_artifact_filter(
 
     task_config = {"artifacts": ["BrowserHistory"]}
 
-    result = extract_task.__class__.run(
-        mock_celery_task,
-        task_config=task_config,
-        output_path="/tmp/output",
-        workflow_id="workflow-123",
-    )
+    result = extract_task.apply(
+        kwargs={
+            "task_config": task_config,
+            "output_path": "/tmp/output",
+            "workflow_id": "workflow-123",
+        }
+    ).get()
 
     assert result == "task_result"
 
     # Verify command
-    mock_dependencies["popen"].assert_called()
-    call_args = mock_dependencies["popen"].call_args[0][0]
+    mock_dependencies["subprocess"].Popen.assert_called()
+    call_args = mock_dependencies["subprocess"].Popen.call_args[0][0]
     assert "image_export.py" in call_args
     assert "--artifact_filters" in call_args
     assert "BrowserHistory" in call_args
     assert "test.dd" in call_args
 
 
-@patch("src.image_export.telemetry")
-def test_extract_task_file_filters(mock_telemetry, mock_celery_task, mock_dependencies):
+def test_extract_task_file_filters(mock_send_event, mock_dependencies):
     """Test extract_task with filename and extension filters."""
     mock_dependencies["get_input_files"].return_value = [{"path": "test.dd", "id": "1"}]
     mock_dependencies["create_task_result"].return_value = "task_result"
 
-    mock_process = MagicMock()
+    mock_process = popen_process()
     mock_process.poll.return_value = 0
     mock_process.stdout.read.return_value = "Process output"
     mock_process.stderr.read.return_value = ""
-    mock_dependencies["popen"].return_value = mock_process
+    mock_dependencies["subprocess"].Popen.return_value = mock_process
 
-    mock_dependencies["glob"].return_value = []  # No files extracted
+    mock_dependencies["Path"].return_value.glob.return_value = []  # No files extracted
 
     task_config = {
         "filenames": "evil.exe",
@@ -201,16 +189,17 @@ def test_extract_task_file_filters(mock_telemetry, mock_celery_task, mock_depend
         "file_signatures": ["exe_mz"],
     }
 
-    extract_task.__class__.run(
-        mock_celery_task,
-        task_config=task_config,
-        output_path="/tmp/output",
-        workflow_id="workflow-123",
-    )
+    extract_task.apply(
+        kwargs={
+            "task_config": task_config,
+            "output_path": "/tmp/output",
+            "workflow_id": "workflow-123",
+        }
+    ).get()
 
     # Verify command
-    mock_dependencies["popen"].assert_called()
-    call_args = mock_dependencies["popen"].call_args[0][0]
+    mock_dependencies["subprocess"].Popen.assert_called()
+    call_args = mock_dependencies["subprocess"].Popen.call_args[0][0]
     assert "--names" in call_args
     assert "evil.exe" in call_args
     assert "--extensions" in call_args
@@ -219,35 +208,33 @@ def test_extract_task_file_filters(mock_telemetry, mock_celery_task, mock_depend
     assert "exe_mz" in call_args
 
 
-@patch("src.image_export.telemetry")
-def test_extract_task_combined_filters(
-    mock_telemetry, mock_celery_task, mock_dependencies
-):
+def test_extract_task_combined_filters(mock_send_event, mock_dependencies):
     """Test extract_task runs separate commands for artifact and file filters."""
     mock_dependencies["get_input_files"].return_value = [{"path": "test.dd", "id": "1"}]
     mock_dependencies["create_task_result"].return_value = "task_result"
 
-    mock_process = MagicMock()
+    mock_process = popen_process()
     mock_process.poll.return_value = 0
     mock_process.stdout.read.return_value = ""
     mock_process.stderr.read.return_value = ""
-    mock_dependencies["popen"].return_value = mock_process
-    mock_dependencies["glob"].return_value = []
+    mock_dependencies["subprocess"].Popen.return_value = mock_process
+    mock_dependencies["Path"].return_value.glob.return_value = []
 
     task_config = {"artifacts": ["BrowserHistory"], "filenames": "evil.exe"}
 
-    extract_task.__class__.run(
-        mock_celery_task,
-        task_config=task_config,
-        output_path="/tmp/output",
-        workflow_id="workflow-123",
-    )
+    extract_task.apply(
+        kwargs={
+            "task_config": task_config,
+            "output_path": "/tmp/output",
+            "workflow_id": "workflow-123",
+        }
+    ).get()
 
     # Should be called twice
-    assert mock_dependencies["popen"].call_count == 2
+    assert mock_dependencies["subprocess"].Popen.call_count == 2
 
     # Inspect calls...
-    calls = mock_dependencies["popen"].call_args_list
+    calls = mock_dependencies["subprocess"].Popen.call_args_list
     args1 = calls[0][0][0]
     args2 = calls[1][0][0]
 
@@ -262,34 +249,28 @@ def test_extract_task_combined_filters(
     )
 
 
-@patch("src.image_export.telemetry")
-def test_extract_task_output_processing(
-    mock_telemetry, mock_celery_task, mock_dependencies
-):
+def test_extract_task_output_processing(mock_send_event, mock_dependencies, fake_path):
     """Test output file processing and linking."""
     mock_dependencies["get_input_files"].return_value = [{"path": "test.dd", "id": "1"}]
     mock_dependencies["create_task_result"].return_value = "task_result"
 
-    mock_process = MagicMock()
+    mock_process = popen_process()
     mock_process.poll.return_value = 0
     mock_process.stdout.read.return_value = ""
     mock_process.stderr.read.return_value = ""
-    mock_dependencies["popen"].return_value = mock_process
+    mock_dependencies["subprocess"].Popen.return_value = mock_process
 
     # Mock extracted file
-    mock_file = MagicMock()
-    mock_file.is_file.return_value = True
-    mock_file.name = "extracted.txt"
-    mock_file.absolute.return_value.name = "extracted.txt"
-    mock_file.relative_to.return_value = "relative/extracted.txt"
+    mock_file = fake_path("extracted.txt", "relative/extracted.txt")
 
     # Mock artifacts map file which should be ignored
-    mock_map_file = MagicMock()
-    mock_map_file.is_file.return_value = True
-    mock_map_file.absolute.return_value.name = "artifacts_map.json"
+    mock_map_file = fake_path("artifacts_map.json", "artifacts_map.json")
 
     # glob returns both
-    mock_dependencies["glob"].return_value = [mock_file, mock_map_file]
+    mock_dependencies["Path"].return_value.glob.return_value = [
+        mock_file,
+        mock_map_file,
+    ]
 
     # Mock fallback to generic type
     mock_dependencies["get_artifact_types"].return_value = []
@@ -302,12 +283,13 @@ def test_extract_task_output_processing(
 
     task_config = {"artifacts": ["Something"]}
 
-    extract_task.__class__.run(
-        mock_celery_task,
-        task_config=task_config,
-        output_path="/tmp/output",
-        workflow_id="workflow-123",
-    )
+    extract_task.apply(
+        kwargs={
+            "task_config": task_config,
+            "output_path": "/tmp/output",
+            "workflow_id": "workflow-123",
+        }
+    ).get()
 
     # Verify create_output_file called with fallback type
     mock_dependencies["create_output_file"].assert_called()
@@ -319,27 +301,22 @@ def test_extract_task_output_processing(
     assert kwargs["source_file_id"] == "1"
 
 
-@patch("src.image_export.telemetry")
 def test_extract_task_output_processing_with_artifact_types(
-    mock_telemetry, mock_celery_task, mock_dependencies
+    mock_send_event, mock_dependencies, fake_path
 ):
     """Test output file processing with identified artifact types."""
     mock_dependencies["get_input_files"].return_value = [{"path": "test.dd", "id": "1"}]
     mock_dependencies["create_task_result"].return_value = "task_result"
 
-    mock_process = MagicMock()
+    mock_process = popen_process()
     mock_process.poll.return_value = 0
     mock_process.stdout.read.return_value = ""
     mock_process.stderr.read.return_value = ""
-    mock_dependencies["popen"].return_value = mock_process
+    mock_dependencies["subprocess"].Popen.return_value = mock_process
 
-    mock_file = MagicMock()
-    mock_file.is_file.return_value = True
-    mock_file.name = "extracted.txt"
-    mock_file.absolute.return_value.name = "extracted.txt"
-    mock_file.relative_to.return_value = "relative/extracted.txt"
+    mock_file = fake_path("extracted.txt", "relative/extracted.txt")
 
-    mock_dependencies["glob"].return_value = [mock_file]
+    mock_dependencies["Path"].return_value.glob.return_value = [mock_file]
 
     mock_dependencies["get_artifact_types"].return_value = [
         "extraction:image_export:artifact:TypeA",
@@ -353,11 +330,12 @@ def test_extract_task_output_processing_with_artifact_types(
 
     task_config = {"artifacts": ["Something"]}
 
-    extract_task.__class__.run(
-        mock_celery_task,
-        task_config=task_config,
-        output_path="/tmp/output",
-        workflow_id="workflow-123",
-    )
+    extract_task.apply(
+        kwargs={
+            "task_config": task_config,
+            "output_path": "/tmp/output",
+            "workflow_id": "workflow-123",
+        }
+    ).get()
 
     assert mock_dependencies["create_output_file"].call_count == 2
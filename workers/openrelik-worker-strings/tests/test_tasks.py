@@ -24,45 +24,41 @@ def test_strings_encoding_enum():
     assert tasks.StringsEncoding.UTF16LE == "l"
 
 
-@mock.patch("builtins.open", new_callable=mock.mock_open)
-@mock.patch("src.tasks.telemetry")
-@mock.patch("src.tasks.get_input_files")
-@mock.patch("src.tasks.create_output_file")
-@mock.patch("src.tasks.create_task_result")
-@mock.patch("src.tasks.subprocess.Popen")
-@mock.patch("src.tasks.count_file_lines")
-@mock.patch("src.tasks.time.sleep")
-def test_strings_task_success(
-    mock_sleep,
-    mock_count_lines,
-    mock_popen,
-    mock_create_result,
-    mock_create_output,
-    mock_get_input,
-    mock_telemetry,
-    mock_open,
-):
+def test_strings_task_success():
     """Test the strings task with valid input and config."""
-    # Setup mocks
-    mock_get_input.return_value = [
-        {"path": "/tmp/test_file.txt", "display_name": "test_file.txt"}
-    ]
-
-    mock_output_file = mock.Mock()
-    mock_output_file.path = "/tmp/output/test_file.txt.s_strings"
-    mock_output_file.to_dict.return_value = {
-        "path": "/tmp/output/test_file.txt.s_strings"
-    }
-    mock_create_output.return_value = mock_output_file
+    with (
+        mock.patch.multiple(
+            "src.tasks",
+            telemetry=mock.DEFAULT,
+            get_input_files=mock.DEFAULT,
+            create_output_file=mock.DEFAULT,
+            create_task_result=mock.DEFAULT,
+            count_file_lines=mock.DEFAULT,
+        ) as mocks,
+        mock.patch("src.tasks.subprocess.Popen") as mock_popen,
+        mock.patch("src.tasks.time.sleep"),
+        mock.patch("builtins.open", new_callable=mock.mock_open) as mock_open,
+        # We need to mock send_event on the task instance itself
+        mock.patch.object(tasks.strings, "send_event") as mock_send_event,
+    ):
+        # Setup mocks
+        mocks["get_input_files"].return_value = [
+            {"path": "/tmp/test_file.txt", "display_name": "test_file.txt"}
+        ]
+
+        mock_output_file = mock.Mock()
+        mock_output_file.path = "/tmp/output/test_file.txt.s_strings"
+        mock_output_file.to_dict.return_value = {
+            "path": "/tmp/output/test_file.txt.s_strings"
+        }
+        mocks["create_output_file"].return_value = mock_output_file
+
+        mock_process = mock.Mock()
+        mock_process.poll.side_effect = [None, 0]  # Run once then finish
+        mock_popen.return_value = mock_process
+
+        mocks["count_file_lines"].return_value = 100
 
-    mock_process = mock.Mock()
-    mock_process.poll.side_effect = [None, 0]  # Run once then finish
-    mock_popen.return_value = mock_process
-
-    mock_count_lines.return_value = 100
-
-    # We need to mock send_event on the task instance itself
-    with mock.patch.object(tasks.strings, "send_event") as mock_send_event:
         # Call the task
         tasks.strings.run(
             pipe_result="dummy_pipe",
@@ -72,14 +68,14 @@ def test_strings_task_success(
             task_config={"ASCII": True},
         )
 
-        # Verify progress reporting
-        mock_send_event.assert_called_with(
-            "task-progress", data={"extracted_strings": 100, "rate": mock.ANY}
-        )
+    # Verify progress reporting
+    mock_send_event.assert_called_with(
+        "task-progress", data={"extracted_strings": 100, "rate": mock.ANY}
+    )
 
     # Verifications
-    mock_get_input.assert_called()
-    mock_create_output.assert_called()
+    mocks["get_input_files"].assert_called()
+    mocks["create_output_file"].assert_called()
     mock_open.assert_called_with("/tmp/output/test_file.txt.s_strings", "w")
 
     # Verify command arguments
@@ -96,8 +92,8 @@ def test_strings_task_success(
     args, _ = mock_popen.call_args
     assert args[0] == expected_command
 
-    mock_create_result.assert_called()
-    mock_telemetry.add_attribute_to_current_span.assert_called()
+    mocks["create_task_result"].assert_called()
+    mocks["telemetry"].add_attribute_to_current_span.assert_called()
 
 
 @mock.patch("src.tasks.get_input_files")
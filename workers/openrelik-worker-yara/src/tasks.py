@@ -98,14 +98,14 @@ class YaraMatch:
     score: int
 
 
-def cleanup_fraken_output_log(logfile: OutputFile) -> None:
+def cleanup_fraken_output_log(logfile: OutputFile) -> list[dict]:
     """Cleanup fraken-x output to be one entry per line.
 
     Args:
         logfile: Output file created by fraken-x
 
     Returns:
-        None
+        List of the fraken-x entries written to the logfile.
     """
     extracted_dicts = []
     try:
@@ -124,7 +124,7 @@ def cleanup_fraken_output_log(logfile: OutputFile) -> None:
                     continue
     except FileNotFoundError:
         logger.warning("Could not find fraken-x outputfile.")
-        return
+        return extracted_dicts
 
     with open(logfile.path, "w") as f:
         if not extracted_dicts:
@@ -132,6 +132,8 @@ def cleanup_fraken_output_log(logfile: OutputFile) -> None:
         else:
             json.dump(extracted_dicts, f)
 
+    return extracted_dicts
+
 
 def generate_report_from_matches(matches: list[YaraMatch]) -> Report:
     """Generate a report from Yara matches.
@@ -1,24 +1,27 @@
 import json
 import pytest
-import shutil
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 from src.tasks import cleanup_fraken_output_log
 
 
+@pytest.fixture(scope="session")
+def fraken_out_bytes():
+    """Reads the fraken-x test data once per test session."""
+    return Path("test_data/fraken_out.jsonl").read_bytes()
+
+
 @pytest.fixture
-def mock_logfile(tmp_path):
+def mock_logfile(tmp_path, fraken_out_bytes):
     """
-    Copies the real test data to a temp directory to protect the source file
+    Writes the test data to a temp directory to protect the source file
     from the function's overwrite.
     """
-    source_file = "test_data/fraken_out.jsonl"
     temp_file = tmp_path / "fraken_out_temp.jsonl"
+    temp_file.write_bytes(fraken_out_bytes)
 
-    shutil.copy(source_file, temp_file)
-
-    logfile = MagicMock()
-    logfile.path = str(temp_file)
-    return logfile
+    return SimpleNamespace(path=str(temp_file))
 
 
 @pytest.fixture
@@ -29,26 +32,24 @@ def mock_logger():
 
 
 def test_cleanup_successful(mock_logfile):
-    """Verifies that the file is correctly flattened and written."""
-    cleanup_fraken_output_log(mock_logfile)
-
-    with open(mock_logfile.path, "r") as f:
-        lines = f.readlines()
+    """Verifies that the entries are correctly flattened."""
+    data = cleanup_fraken_output_log(mock_logfile)
 
+    assert isinstance(data, list)
+    assert len(data) == 2
     # Verify the first entry's content
     assert (
-        "2aab6dc411baf0605a1b284128323709e38b0f1d147d09cfbc24997acb9527eb" in lines[0]
+        data[0]["SHA256"]
+        == "2aab6dc411baf0605a1b284128323709e38b0f1d147d09cfbc24997acb9527eb"
     )
-    # Verify it is no longer wrapped in a list (starts with { not [)
-    assert lines[0].startswith("[{")
+    assert data[0]["ImagePath"].endswith("test_input.txt")
 
 
 def test_cleanup_file_not_found(mock_logger):
     """Verifies error handling when the path is invalid."""
-    logfile = MagicMock()
-    logfile.path = "non_existent.jsonl"
+    logfile = SimpleNamespace(path="non_existent.jsonl")
 
-    cleanup_fraken_output_log(logfile)
+    assert cleanup_fraken_output_log(logfile) == []
 
     mock_logger.warning.assert_called_with("Could not find fraken-x outputfile.")
 
@@ -58,8 +59,9 @@ def test_cleanup_corrupt_json(mock_logfile, mock_logger):
     with open(mock_logfile.path, "a") as f:
         f.write("invalid json line\n")
 
-    cleanup_fraken_output_log(mock_logfile)
+    data = cleanup_fraken_output_log(mock_logfile)
 
+    assert len(data) == 2
     assert mock_logger.warning.called
     assert any(
         "could not parse" in str(call) for call in mock_logger.warning.call_args_list
@@ -67,16 +69,14 @@ def test_cleanup_corrupt_json(mock_logfile, mock_logger):
 
 
 def test_cleanup_no_valid_data(tmp_path):
-    """Verifies that if only empty lists exist, the returned file is empty."""
+    """Verifies that if only empty lists exist, an empty JSON array is written."""
     # Create a file with only empty lists
     empty_file = tmp_path / "empty.jsonl"
     empty_file.write_text("[]\n[]\n")
 
-    logfile = MagicMock()
-    logfile.path = str(empty_file)
-
-    cleanup_fraken_output_log(logfile)
+    logfile = SimpleNamespace(path=str(empty_file))
 
+    assert cleanup_fraken_output_log(logfile) == []
     assert empty_file.read_text() == "[]"
 
 